@@ -12,15 +12,20 @@ This script uses the DataScrubber class to clean all CSV files:
 - customers_data.csv
 - products_data.csv
 
-It reads from data/raw/ and writes cleaned files to data/prepared/
+It reads from data/raw/ and writes cleaned Parquet files to data/prepared/
 
 Usage:
     python src/analytics_project/data_prep.py
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
 import sys
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow.csv as pacsv
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent.parent
@@ -28,7 +33,7 @@ sys.path.insert(0, str(project_root))
 
 # Import DataScrubber and logger
 from src.analytics_project.data_scrubber import DataScrubber
-from src.analytics_project.utils_logger import logger
+from src.analytics_project.utils_logger import init_logger, logger
 
 # Define paths
 DATA_DIR = project_root / "data"
@@ -41,12 +46,14 @@ RAW_DATA_DIR.mkdir(exist_ok=True)
 PREPARED_DATA_DIR.mkdir(exist_ok=True)
 
 
-def read_csv_file(file_name: str) -> pd.DataFrame:
+def read_csv_file(file_name: str, usecols: list[str] | None = None) -> pd.DataFrame:
     """
     Read a CSV file from the raw data directory.
 
     Args:
         file_name (str): Name of the CSV file.
+        usecols (list[str], optional): Columns to load, in this order. The parser skips
+            all other columns. Defaults to None (all columns).
 
     Returns:
         pd.DataFrame: Loaded DataFrame.
@@ -58,30 +65,186 @@ def read_csv_file(file_name: str) -> pd.DataFrame:
         logger.error(f"File not found: {file_path}")
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    df = pd.read_csv(file_path)
+    # Parse with PyArrow's multithreaded reader; '?' is treated as null alongside
+    # the default NA markers so it never reaches the cleaners as a string
+    null_values = [*pacsv.ConvertOptions().null_values, '?']
+    table = pacsv.read_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 24),
+        convert_options=pacsv.ConvertOptions(
+            null_values=null_values,
+            strings_can_be_null=True,
+            include_columns=usecols or [],
+        ),
+    )
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
     logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
     logger.info(f"Columns: {', '.join(df.columns.tolist())}")
 
     return df
 
 
-def save_csv_file(df: pd.DataFrame, file_name: str) -> None:
+def shrink_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast columns to the smallest dtypes that hold their values.
+
+    Integers go to the narrowest unsigned/signed width, floats to float32 when that
+    loses no precision, and low-cardinality string columns (fewer than half the
+    values unique) to category.
+
+    Args:
+        df (pd.DataFrame): Cleaned DataFrame.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with shrunken dtypes.
+    """
+    if df.empty:
+        return df
+
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_bool_dtype(series) or series.isna().all():
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            downcast = 'unsigned' if series.min() >= 0 else 'integer'
+            df[column] = pd.to_numeric(series, downcast=downcast)
+        elif pd.api.types.is_float_dtype(series):
+            # Prepared files are binary, so a lossy float32 would persist into the warehouse
+            shrunk = pd.to_numeric(series, downcast='float')
+            if shrunk.astype(series.dtype).equals(series):
+                df[column] = shrunk
+        elif pd.api.types.is_string_dtype(series) and series.nunique() / len(df) < 0.5:
+            df[column] = series.astype('category')
+
+    logger.info(f"Shrunk dtypes: {df.dtypes.astype(str).to_dict()}")
+    return df
+
+
+def save_prepared(df: pd.DataFrame, file_name: str) -> None:
     """
-    Save a DataFrame to the prepared data directory.
+    Save a DataFrame to the prepared data directory as zstd-compressed Parquet.
 
     Args:
         df (pd.DataFrame): DataFrame to save.
-        file_name (str): Name of the output CSV file.
+        file_name (str): Name of the output Parquet file.
     """
     output_path = PREPARED_DATA_DIR / file_name
-    df.to_csv(output_path, index=False)
+    df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
     logger.info(f"Saved cleaned data to: {output_path}")
     logger.info(f"Final shape: {df.shape}")
 
 
+def format_strings_upper_and_trim(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """
+    Uppercase and trim string columns using Arrow's vectorized string kernels.
+
+    Columns not present in the DataFrame are skipped. Nulls stay null.
+
+    Args:
+        df (pd.DataFrame): DataFrame to format.
+        columns (list[str]): Names of the string columns to format.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with the columns formatted.
+    """
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype('string[pyarrow]').str.upper().str.strip()
+    return df
+
+
+def drop_duplicates_sorted(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Keep the first row for each key and return the rows sorted by that key.
+
+    For numeric keys one np.unique pass replaces drop_duplicates followed by
+    sort_values. Other keys cannot be ordered by NumPy once they contain a null, so
+    they use drop_duplicates and a stable sort. Either way a missing key is kept
+    once and sorted last.
+
+    Args:
+        df (pd.DataFrame): DataFrame to deduplicate.
+        column (str): Key column.
+
+    Returns:
+        pd.DataFrame: Deduplicated DataFrame ordered by `column`, with a fresh index.
+    """
+    if not pd.api.types.is_numeric_dtype(df[column]):
+        return df.drop_duplicates(subset=[column]).sort_values(
+            column, kind='mergesort', ignore_index=True
+        )
+
+    keys = df[column].to_numpy(na_value=np.nan)
+    _, first_index = np.unique(keys, return_index=True)
+    return df.take(first_index).reset_index(drop=True)
+
+
+def log_consistency_before_cleaning(scrubber: DataScrubber) -> None:
+    """
+    Log null and duplicate counts at DEBUG level.
+
+    The counts scan every column, so they are computed lazily and only when a
+    DEBUG sink is active. Run with init_logger(level="DEBUG") to see them.
+
+    Args:
+        scrubber (DataScrubber): Scrubber wrapping the raw DataFrame.
+    """
+
+    def summarize() -> str:
+        consistency = scrubber.check_data_consistency_before_cleaning()
+        null_counts = consistency['null_counts']
+        return (
+            f"Null values before cleaning:\n{null_counts[null_counts > 0]}\n"
+            f"Duplicate rows before cleaning: {consistency['duplicate_count']}"
+        )
+
+    logger.opt(lazy=True).debug("{}", summarize)
+
+
+def compute_quartiles(column: pd.Series | np.ndarray) -> tuple[float, float]:
+    """
+    Compute Q1 and Q3 of a numeric column with np.partition instead of a full sort.
+
+    Both quartiles come from a single partition pass. Matches pd.Series.quantile
+    (linear interpolation, nulls skipped).
+
+    Args:
+        column (pd.Series | np.ndarray): Numeric column, or its values as an array.
+
+    Returns:
+        tuple[float, float]: (Q1, Q3), or (nan, nan) if the column has no values.
+    """
+    if isinstance(column, pd.Series):
+        values = column.to_numpy(dtype='float64', na_value=np.nan)
+    else:
+        values = np.asarray(column, dtype='float64')
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n == 0:
+        return np.nan, np.nan
+
+    positions = (0.25 * (n - 1), 0.75 * (n - 1))
+    neighbours = {int(p) for p in positions} | {min(int(p) + 1, n - 1) for p in positions}
+    partitioned = np.partition(values, sorted(neighbours))
+
+    def interpolate(position: float) -> float:
+        below = int(position)
+        above = min(below + 1, n - 1)
+        return float(
+            partitioned[below] + (partitioned[above] - partitioned[below]) * (position - below)
+        )
+
+    return interpolate(positions[0]), interpolate(positions[1])
+
+
 def clean_sales_data(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Clean sales data using DataScrubber.
+    Clean sales data with a lazy Polars query.
+
+    Dedupe, coerce, fill, filter, format, and sort are built as one plan and executed
+    once, so Polars can fuse and parallelize them. The row count and Shipping median
+    logged for the intermediate steps are collected in the same run. IQR outliers are
+    removed afterwards with NumPy on the collected SaleAmount column.
 
     Args:
         df (pd.DataFrame): Raw sales DataFrame.
@@ -96,49 +259,52 @@ def clean_sales_data(df: pd.DataFrame) -> pd.DataFrame:
     initial_shape = df.shape
     logger.info(f"Initial shape: {initial_shape}")
 
+    # Cleaning never adds or drops columns, so look them up in one hashed set
+    present_columns = frozenset(df.columns)
+
     # Check data consistency before cleaning
     scrubber = DataScrubber(df)
-    consistency_before = scrubber.check_data_consistency_before_cleaning()
-    logger.info(
-        f"Null values before cleaning:\n{consistency_before['null_counts'][consistency_before['null_counts'] > 0]}"
-    )
-    logger.info(f"Duplicate rows before cleaning: {consistency_before['duplicate_count']}")
+    log_consistency_before_cleaning(scrubber)
 
-    # Clean the data
-    scrubber = DataScrubber(df)
+    # The reader hands over Arrow-backed columns, so this conversion is mostly zero-copy
+    lf = pl.from_pandas(scrubber.get_dataframe()).lazy()
 
     # Step 1: Remove duplicates
-    scrubber.remove_duplicate_records()
-    logger.info(f"After removing duplicates: {scrubber.get_dataframe().shape}")
+    lf = lf.unique(maintain_order=True)
 
     # Step 2: Handle special values in numeric columns
-    df_temp = scrubber.get_dataframe()
-
-    # Replace '?' with NaN in SaleAmount
-    if 'SaleAmount' in df_temp.columns:
-        df_temp['SaleAmount'] = pd.to_numeric(df_temp['SaleAmount'], errors='coerce')
+    # '?' in SaleAmount is already null from the reader; anything else unparseable becomes null
+    numeric = []
+    if 'SaleAmount' in present_columns:
+        numeric.append(pl.col('SaleAmount').cast(pl.Float64, strict=False))
 
     # Replace 'free' with 0 in Shipping
-    if 'Shipping' in df_temp.columns:
-        df_temp['Shipping'] = df_temp['Shipping'].replace('free', '0')
-        df_temp['Shipping'] = pd.to_numeric(df_temp['Shipping'], errors='coerce')
+    if 'Shipping' in present_columns:
+        numeric.append(
+            pl.col('Shipping')
+            .cast(pl.String)
+            .str.strip_chars()
+            .replace('free', '0')
+            .cast(pl.Float64, strict=False)
+        )
+    lf = lf.with_columns(numeric)
 
-    # Update scrubber with cleaned data
-    scrubber = DataScrubber(df_temp)
+    # Collected together with the cleaned frame, for the step logs below
+    step_stats = [pl.len().alias('rows_after_dedupe')]
+    if 'Shipping' in present_columns:
+        step_stats.append(pl.col('Shipping').median().alias('shipping_median'))
+    stats_lf = lf.select(step_stats)
 
     # Step 3: Handle missing values
-    # Fill CampaignID with 0 (no campaign)
-    df_temp = scrubber.get_dataframe()
-    if 'CampaignID' in df_temp.columns:
-        df_temp['CampaignID'] = df_temp['CampaignID'].fillna(0)
-
-    # Fill Shipping with median
-    if 'Shipping' in df_temp.columns:
-        median_shipping = df_temp['Shipping'].median()
-        df_temp['Shipping'] = df_temp['Shipping'].fillna(median_shipping)
-        logger.info(f"Filled missing Shipping with median: {median_shipping}")
-
-    # Drop rows with missing critical values
+    # Fill CampaignID with 0 (no campaign) and Shipping with its median
+    fills = []
+    if 'CampaignID' in present_columns:
+        fills.append(pl.col('CampaignID').fill_null(0))
+    if 'Shipping' in present_columns:
+        fills.append(pl.col('Shipping').fill_null(pl.col('Shipping').median()))
+    lf = lf.with_columns(fills)
+
+    # Step 4: Drop rows with missing critical values or negative amounts
     critical_columns = [
         'TransactionID',
         'SaleDate',
@@ -147,48 +313,63 @@ def clean_sales_data(df: pd.DataFrame) -> pd.DataFrame:
         'StoreID',
         'SaleAmount',
     ]
-    existing_critical = [col for col in critical_columns if col in df_temp.columns]
-    df_temp = df_temp.dropna(subset=existing_critical)
-    logger.info(f"After removing rows with missing critical values: {df_temp.shape}")
+    existing_critical = [col for col in critical_columns if col in present_columns]
+    if existing_critical:
+        lf = lf.drop_nulls(existing_critical)
 
-    # Update scrubber
-    scrubber = DataScrubber(df_temp)
+    # Remove negative values
+    if 'SaleAmount' in present_columns:
+        lf = lf.filter(pl.col('SaleAmount') >= 0)
+    if 'Shipping' in present_columns:
+        lf = lf.filter(pl.col('Shipping') >= 0)
 
-    # Step 4: Format State column to uppercase
-    if 'State' in df_temp.columns:
-        scrubber.format_column_strings_to_upper_and_trim('State')
-        logger.info("Formatted State column to uppercase")
+    # Step 5: Format State column to uppercase
+    # Step 6: Convert date column
+    formats = []
+    if 'State' in present_columns:
+        formats.append(pl.col('State').str.to_uppercase().str.strip_chars())
+    if 'SaleDate' in present_columns:
+        # The reader already types ISO dates as dates and an all-empty column as null
+        if lf.collect_schema()['SaleDate'].is_temporal():
+            formats.append(pl.col('SaleDate').cast(pl.Datetime))
+        else:
+            formats.append(
+                pl.col('SaleDate').cast(pl.String).str.to_datetime('%m/%d/%Y', strict=False)
+            )
+    lf = lf.with_columns(formats)
 
-    # Step 5: Remove outliers using IQR method
-    df_temp = scrubber.get_dataframe()
+    # Step 7: Sort by TransactionID
+    if 'TransactionID' in present_columns:
+        lf = lf.sort('TransactionID')
 
-    # Remove negative values
-    if 'SaleAmount' in df_temp.columns:
-        df_temp = df_temp[df_temp['SaleAmount'] >= 0]
-    if 'Shipping' in df_temp.columns:
-        df_temp = df_temp[df_temp['Shipping'] >= 0]
-
-    # IQR for SaleAmount
-    if 'SaleAmount' in df_temp.columns:
-        Q1 = df_temp['SaleAmount'].quantile(0.25)
-        Q3 = df_temp['SaleAmount'].quantile(0.75)
+    logger.opt(lazy=True).debug("Sales cleaning plan:\n{}", lf.explain)
+    df_clean, stats = pl.collect_all([lf, stats_lf], engine='streaming')
+
+    logger.info(f"After removing duplicates: ({stats['rows_after_dedupe'][0]}, {df.shape[1]})")
+    if 'Shipping' in present_columns:
+        logger.info(f"Filled missing Shipping with median: {stats['shipping_median'][0]}")
+    if 'State' in present_columns:
+        logger.info("Formatted State column to uppercase")
+    if 'SaleDate' in present_columns:
+        logger.info("Converted SaleDate to datetime")
+
+    # Step 8: Remove SaleAmount outliers using IQR method
+    # The quartiles need the fully filtered column, so this runs after the plan. The column
+    # is read once: one partition yields both quartiles and one pass builds the row mask.
+    # Filtering keeps row order, so the sort above still holds.
+    if 'SaleAmount' in present_columns:
+        sale_amount = df_clean['SaleAmount'].to_numpy()
+        Q1, Q3 = compute_quartiles(sale_amount)
         IQR = Q3 - Q1
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
 
-        scrubber = DataScrubber(df_temp)
-        scrubber.filter_column_outliers('SaleAmount', lower_bound, upper_bound)
-        df_temp = scrubber.get_dataframe()
+        in_range = (sale_amount >= lower_bound) & (sale_amount <= upper_bound)
+        df_clean = df_clean.filter(pl.Series(in_range))
         logger.info(f"Removed SaleAmount outliers. Range: [{lower_bound:.2f}, {upper_bound:.2f}]")
 
-    # Step 6: Convert date column
-    if 'SaleDate' in df_temp.columns:
-        df_temp['SaleDate'] = pd.to_datetime(df_temp['SaleDate'], errors='coerce')
-        logger.info("Converted SaleDate to datetime")
-
-    # Step 7: Sort by TransactionID
-    if 'TransactionID' in df_temp.columns:
-        df_temp = df_temp.sort_values('TransactionID').reset_index(drop=True)
+    df_temp = df_clean.to_pandas()
+    logger.info(f"After removing missing, negative, and outlier rows: {df_temp.shape}")
 
     final_shape = df_temp.shape
     rows_removed = initial_shape[0] - final_shape[0]
@@ -215,62 +396,59 @@ def clean_customers_data(df: pd.DataFrame) -> pd.DataFrame:
     initial_shape = df.shape
     logger.info(f"Initial shape: {initial_shape}")
 
+    # Column guards below check this set, as in clean_sales_data
+    present_columns = frozenset(df.columns)
+
     # Initialize scrubber
     scrubber = DataScrubber(df)
 
     # Check consistency
-    consistency_before = scrubber.check_data_consistency_before_cleaning()
-    logger.info(
-        f"Null values before cleaning:\n{consistency_before['null_counts'][consistency_before['null_counts'] > 0]}"
-    )
-    logger.info(f"Duplicate rows before cleaning: {consistency_before['duplicate_count']}")
+    log_consistency_before_cleaning(scrubber)
 
-    # Step 1: Remove duplicates based on CustomerID
-    df_temp = scrubber.get_dataframe()
-    df_temp = df_temp.drop_duplicates(subset=['CustomerID'], keep='first')
+    # Step 1: Remove duplicates based on CustomerID, leaving rows sorted by CustomerID
+    df_temp = drop_duplicates_sorted(scrubber.get_dataframe(), 'CustomerID')
     logger.info(f"After removing duplicates: {df_temp.shape}")
 
     # Step 2: Format string columns
-    scrubber = DataScrubber(df_temp)
-
-    if 'Name' in df_temp.columns:
-        scrubber.format_column_strings_to_upper_and_trim('Name')
-
-    if 'Region' in df_temp.columns:
-        scrubber.format_column_strings_to_upper_and_trim('Region')
-
+    df_temp = format_strings_upper_and_trim(df_temp, ['Name', 'Region'])
     logger.info("Formatted string columns to uppercase")
 
     # Step 3: Handle missing values
-    df_temp = scrubber.get_dataframe()
-
     # Drop rows with missing CustomerID or Name
     critical_columns = ['CustomerID', 'Name']
-    existing_critical = [col for col in critical_columns if col in df_temp.columns]
+    existing_critical = [col for col in critical_columns if col in present_columns]
     df_temp = df_temp.dropna(subset=existing_critical)
 
     # Fill missing Region with 'UNKNOWN'
-    if 'Region' in df_temp.columns:
+    if 'Region' in present_columns:
         df_temp['Region'] = df_temp['Region'].fillna('UNKNOWN')
 
     # Fill missing numeric columns with median or 0
-    if 'NumberOfPurshases' in df_temp.columns:
-        df_temp['NumberOfPurshases'] = df_temp['NumberOfPurshases'].fillna(0)
-
-    if 'ShoppingFrequency' in df_temp.columns:
-        df_temp['ShoppingFrequency'] = df_temp['ShoppingFrequency'].fillna(0)
+    # to_numeric turns an all-empty (Arrow null) column into a numeric one before filling
+    if 'NumberOfPurshases' in present_columns:
+        df_temp['NumberOfPurshases'] = pd.to_numeric(
+            df_temp['NumberOfPurshases'], errors='coerce'
+        ).fillna(0)
+
+    # ShoppingFrequency is a string column, so its fill value must be a string too
+    if 'ShoppingFrequency' in present_columns:
+        df_temp['ShoppingFrequency'] = (
+            df_temp['ShoppingFrequency'].astype('string[pyarrow]').fillna('0')
+        )
 
     logger.info(f"After handling missing values: {df_temp.shape}")
 
     # Step 4: Parse JoinDate
-    if 'JoinDate' in df_temp.columns:
-        df_temp['JoinDate'] = pd.to_datetime(df_temp['JoinDate'], errors='coerce')
+    if 'JoinDate' in present_columns:
+        # JoinDate uses the same month/day/year layout as the sales file
+        df_temp['JoinDate'] = pd.to_datetime(
+            df_temp['JoinDate'], format='%m/%d/%Y', errors='coerce', cache=True
+        )
         logger.info("Converted JoinDate to datetime")
 
     # Step 5: Remove outliers from numeric columns
-    if 'NumberOfPurshases' in df_temp.columns:
-        Q1 = df_temp['NumberOfPurshases'].quantile(0.25)
-        Q3 = df_temp['NumberOfPurshases'].quantile(0.75)
+    if 'NumberOfPurshases' in present_columns:
+        Q1, Q3 = compute_quartiles(df_temp['NumberOfPurshases'])
         IQR = Q3 - Q1
         lower_bound = max(0, Q1 - 1.5 * IQR)  # Can't be negative
         upper_bound = Q3 + 1.5 * IQR
@@ -283,9 +461,13 @@ def clean_customers_data(df: pd.DataFrame) -> pd.DataFrame:
             f"Removed NumberOfPurshases outliers. Range: [{lower_bound:.2f}, {upper_bound:.2f}]"
         )
 
-    # Step 6: Sort by CustomerID
-    if 'CustomerID' in df_temp.columns:
-        df_temp = df_temp.sort_values('CustomerID').reset_index(drop=True)
+    # Step 6: Rows are already sorted by CustomerID from Step 1; just renumber them
+    df_temp = df_temp.reset_index(drop=True)
+
+    # Step 7: Dictionary-encode low-cardinality string columns
+    for column in ('Region', 'ShoppingFrequency'):
+        if column in present_columns:
+            df_temp[column] = df_temp[column].astype('category')
 
     final_shape = df_temp.shape
     rows_removed = initial_shape[0] - final_shape[0]
@@ -312,46 +494,35 @@ def clean_products_data(df: pd.DataFrame) -> pd.DataFrame:
     initial_shape = df.shape
     logger.info(f"Initial shape: {initial_shape}")
 
+    # Column guards below check this set, as in clean_sales_data
+    present_columns = frozenset(df.columns)
+
     # Initialize scrubber
     scrubber = DataScrubber(df)
 
     # Check consistency
-    consistency_before = scrubber.check_data_consistency_before_cleaning()
-    logger.info(
-        f"Null values before cleaning:\n{consistency_before['null_counts'][consistency_before['null_counts'] > 0]}"
-    )
-    logger.info(f"Duplicate rows before cleaning: {consistency_before['duplicate_count']}")
+    log_consistency_before_cleaning(scrubber)
 
-    # Step 1: Remove duplicates based on ProductID
-    df_temp = scrubber.get_dataframe()
-    df_temp = df_temp.drop_duplicates(subset=['ProductID'], keep='first')
+    # Step 1: Remove duplicates based on ProductID, leaving rows sorted by ProductID
+    df_temp = drop_duplicates_sorted(scrubber.get_dataframe(), 'ProductID')
     logger.info(f"After removing duplicates: {df_temp.shape}")
 
     # Step 2: Format string columns
-    scrubber = DataScrubber(df_temp)
-
-    if 'ProductName' in df_temp.columns:
-        scrubber.format_column_strings_to_upper_and_trim('ProductName')
-
-    if 'Category' in df_temp.columns:
-        scrubber.format_column_strings_to_upper_and_trim('Category')
-
+    df_temp = format_strings_upper_and_trim(df_temp, ['ProductName', 'Category'])
     logger.info("Formatted string columns to uppercase")
 
     # Step 3: Handle missing values
-    df_temp = scrubber.get_dataframe()
-
     # Drop rows with missing ProductID or ProductName
     critical_columns = ['ProductID', 'ProductName']
-    existing_critical = [col for col in critical_columns if col in df_temp.columns]
+    existing_critical = [col for col in critical_columns if col in present_columns]
     df_temp = df_temp.dropna(subset=existing_critical)
 
     # Fill missing Category with 'UNCATEGORIZED'
-    if 'Category' in df_temp.columns:
+    if 'Category' in present_columns:
         df_temp['Category'] = df_temp['Category'].fillna('UNCATEGORIZED')
 
     # Fill missing Price with median
-    if 'Price' in df_temp.columns:
+    if 'Price' in present_columns:
         df_temp['Price'] = pd.to_numeric(df_temp['Price'], errors='coerce')
         median_price = df_temp['Price'].median()
         df_temp['Price'] = df_temp['Price'].fillna(median_price)
@@ -360,12 +531,11 @@ def clean_products_data(df: pd.DataFrame) -> pd.DataFrame:
     logger.info(f"After handling missing values: {df_temp.shape}")
 
     # Step 4: Remove outliers from Price
-    if 'Price' in df_temp.columns:
+    if 'Price' in present_columns:
         # Remove negative prices
         df_temp = df_temp[df_temp['Price'] >= 0]
 
-        Q1 = df_temp['Price'].quantile(0.25)
-        Q3 = df_temp['Price'].quantile(0.75)
+        Q1, Q3 = compute_quartiles(df_temp['Price'])
         IQR = Q3 - Q1
         lower_bound = max(0, Q1 - 1.5 * IQR)
         upper_bound = Q3 + 1.5 * IQR
@@ -373,9 +543,12 @@ def clean_products_data(df: pd.DataFrame) -> pd.DataFrame:
         df_temp = df_temp[(df_temp['Price'] >= lower_bound) & (df_temp['Price'] <= upper_bound)]
         logger.info(f"Removed Price outliers. Range: [{lower_bound:.2f}, {upper_bound:.2f}]")
 
-    # Step 5: Sort by ProductID
-    if 'ProductID' in df_temp.columns:
-        df_temp = df_temp.sort_values('ProductID').reset_index(drop=True)
+    # Step 5: Rows are already sorted by ProductID from Step 1; just renumber them
+    df_temp = df_temp.reset_index(drop=True)
+
+    # Step 6: Dictionary-encode low-cardinality string columns
+    if 'Category' in present_columns:
+        df_temp['Category'] = df_temp['Category'].astype('category')
 
     final_shape = df_temp.shape
     rows_removed = initial_shape[0] - final_shape[0]
@@ -385,10 +558,36 @@ def clean_products_data(df: pd.DataFrame) -> pd.DataFrame:
     return df_temp
 
 
+def _clean_one(file_info: dict) -> None:
+    """
+    Read, clean, and save a single file. Runs inside a worker process.
+
+    Args:
+        file_info (dict): Entry from files_to_process with 'input', 'output', 'cols',
+            and 'cleaner'.
+    """
+    logger.info(f"\n{'=' * 70}")
+    logger.info(f"Processing: {file_info['input']}")
+    logger.info(f"{'=' * 70}")
+
+    # Read raw data
+    df = read_csv_file(file_info['input'], usecols=file_info['cols'])
+
+    # Clean data
+    cleaned_df = file_info['cleaner'](df)
+    cleaned_df = shrink_dtypes(cleaned_df)
+
+    # Save cleaned data
+    save_prepared(cleaned_df, file_info['output'])
+
+
 def main():
     """
     Main function to clean all CSV files.
     """
+    # INFO by default, so the DEBUG-only consistency scans are skipped
+    init_logger()
+
     logger.info("=" * 70)
     logger.info("STARTING DATA PREPARATION FOR ALL FILES")
     logger.info("=" * 70)
@@ -400,44 +599,69 @@ def main():
     files_to_process = [
         {
             'input': 'sales_data.csv',
-            'output': 'sales_prepared.csv',
+            'output': 'sales_prepared.parquet',
+            'cols': [
+                'TransactionID',
+                'SaleDate',
+                'CustomerID',
+                'ProductID',
+                'StoreID',
+                'CampaignID',
+                'SaleAmount',
+                'Shipping',
+                'State',
+            ],
             'cleaner': clean_sales_data,
         },
         {
             'input': 'customers_data.csv',
-            'output': 'customers_prepared.csv',
+            'output': 'customers_prepared.parquet',
+            'cols': [
+                'CustomerID',
+                'Name',
+                'Region',
+                'JoinDate',
+                'NumberOfPurshases',
+                'ShoppingFrequency',
+            ],
             'cleaner': clean_customers_data,
         },
         {
             'input': 'products_data.csv',
-            'output': 'products_prepared.csv',
+            'output': 'products_prepared.parquet',
+            'cols': [
+                'ProductID',
+                'ProductName',
+                'Category',
+                'UnitPrice',
+                'StockQuantity',
+                'Supplier',
+            ],
             'cleaner': clean_products_data,
         },
     ]
 
-    # Process each file
-    for file_info in files_to_process:
-        try:
-            logger.info(f"\n{'=' * 70}")
-            logger.info(f"Processing: {file_info['input']}")
-            logger.info(f"{'=' * 70}")
-
-            # Read raw data
-            df = read_csv_file(file_info['input'])
-
-            # Clean data
-            cleaned_df = file_info['cleaner'](df)
-
-            # Save cleaned data
-            save_csv_file(cleaned_df, file_info['output'])
-
-            logger.info(f"✓ Successfully processed {file_info['input']}")
-
-        except FileNotFoundError as e:
-            logger.warning(f"⚠ Skipping {file_info['input']}: {e}")
-        except Exception as e:
-            logger.error(f"✗ Error processing {file_info['input']}: {e}")
-            raise
+    # Process each file in its own worker process; the three pipelines share no state.
+    # Importing polars and the loguru writer both start threads in this process, so
+    # fork() could copy a held lock into a worker; spawn starts each worker clean and
+    # the initializer configures its logger.
+    with ProcessPoolExecutor(
+        max_workers=len(files_to_process),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_logger,
+    ) as pool:
+        futures = {pool.submit(_clean_one, file_info): file_info for file_info in files_to_process}
+        for future in as_completed(futures):
+            file_info = futures[future]
+            try:
+                future.result()
+                logger.info(f"✓ Successfully processed {file_info['input']}")
+
+            except FileNotFoundError as e:
+                logger.warning(f"⚠ Skipping {file_info['input']}: {e}")
+            except Exception as e:
+                logger.error(f"✗ Error processing {file_info['input']}: {e}")
+                raise
 
     logger.info("\n" + "=" * 70)
     logger.info("DATA PREPARATION COMPLETED FOR ALL FILES")
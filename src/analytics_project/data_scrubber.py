@@ -34,10 +34,13 @@ class DataScrubber:
         """
         Initialize the DataScrubber with a DataFrame.
 
+        The DataFrame is wrapped, not copied: column-level methods update it in place.
+        Pass df.copy() if the caller's DataFrame must stay untouched.
+
         Parameters:
             df (pd.DataFrame): The DataFrame to be scrubbed.
         """
-        self.df = df.copy()  # Create a copy to avoid modifying original
+        self.df = df
 
     def get_dataframe(self) -> pd.DataFrame:
         """
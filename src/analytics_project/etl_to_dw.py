@@ -41,6 +41,13 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
         )
     """)
 
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS state (
+            state_id INTEGER PRIMARY KEY,
+            state TEXT UNIQUE
+        )
+    """)
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS sale (
             sale_id INTEGER PRIMARY KEY,
@@ -51,36 +58,91 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             sale_amount REAL,
             sale_date TEXT,
             shipping REAL,
-            state TEXT,
+            state_id INTEGER,
             FOREIGN KEY (customer_id) REFERENCES customer (customer_id),
-            FOREIGN KEY (product_id) REFERENCES product (product_id)
+            FOREIGN KEY (product_id) REFERENCES product (product_id),
+            FOREIGN KEY (state_id) REFERENCES state (state_id)
         )
     """)
 
 
+def create_indexes(cursor: sqlite3.Cursor) -> None:
+    """Create secondary indexes. Run after the bulk load so inserts don't maintain them."""
+    # Covering index for the OLAP cube: GROUP BY product_id, SUM(sale_amount)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sale_pid_amt ON sale (product_id, sale_amount)")
+
+
 def delete_existing_records(cursor: sqlite3.Cursor) -> None:
-    """Delete all existing records from the customer, product, and sale tables."""
+    """Delete all existing records from the customer, product, state, and sale tables."""
     cursor.execute("DELETE FROM customer")
     cursor.execute("DELETE FROM product")
+    cursor.execute("DELETE FROM state")
     cursor.execute("DELETE FROM sale")
 
 
+def read_prepared_file(file_name: str) -> pd.DataFrame:
+    """Read a prepared Parquet file, formatting datetime columns as ISO date strings for SQLite."""
+    df = pd.read_parquet(PREPARED_DATA_DIR.joinpath(file_name))
+    for column in df.select_dtypes(include="datetime").columns:
+        df[column] = df[column].dt.strftime("%Y-%m-%d")
+    return df
+
+
+def insert_rows(table: str, df: pd.DataFrame, cursor: sqlite3.Cursor) -> None:
+    """Insert all DataFrame rows into a table with a single executemany call.
+
+    Columns are matched by name, so the DataFrame column order does not need to
+    follow the table definition.
+    """
+    columns = ", ".join(df.columns)
+    placeholders = ", ".join("?" for _ in df.columns)
+    sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"  # noqa: S608
+    # sqlite3 cannot bind pd.NA, so hand it plain Python objects with None for nulls
+    rows = df.astype(object).where(df.notna(), None)
+    cursor.executemany(sql, rows.itertuples(index=False, name=None))
+
+
 def insert_customers(customers_df: pd.DataFrame, cursor: sqlite3.Cursor) -> None:
     """Insert customer data into the customer table."""
     logger.info(f"Inserting {len(customers_df)} customer rows.")
-    customers_df.to_sql("customer", cursor.connection, if_exists="append", index=False)
+    insert_rows("customer", customers_df, cursor)
 
 
 def insert_products(products_df: pd.DataFrame, cursor: sqlite3.Cursor) -> None:
     """Insert product data into the product table."""
     logger.info(f"Inserting {len(products_df)} product rows.")
-    products_df.to_sql("product", cursor.connection, if_exists="append", index=False)
+    insert_rows("product", products_df, cursor)
+
+
+def split_state_dimension(sales_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Replace the sale state text with a state_id key into a small state dimension.
+
+    Returns:
+        tuple: (state_df, sales_df) where sales_df has state_id in place of state.
+    """
+    states = sales_df["state"].astype("category")
+    state_df = pd.DataFrame(
+        {
+            "state_id": range(1, len(states.cat.categories) + 1),
+            "state": states.cat.categories.astype(str),
+        }
+    )
+    # Category codes are 0-based with -1 for missing; missing states get a NULL key
+    codes = pd.Series(states.cat.codes.to_numpy() + 1, index=sales_df.index)
+    sales_df = sales_df.drop(columns="state").assign(state_id=codes.where(codes > 0))
+    return state_df, sales_df
+
+
+def insert_states(state_df: pd.DataFrame, cursor: sqlite3.Cursor) -> None:
+    """Insert state data into the state table."""
+    logger.info(f"Inserting {len(state_df)} state rows.")
+    insert_rows("state", state_df, cursor)
 
 
 def insert_sales(sales_df: pd.DataFrame, cursor: sqlite3.Cursor) -> None:
     """Insert sales data into the sales table."""
     logger.info(f"Inserting {len(sales_df)} sale rows.")
-    sales_df.to_sql("sale", cursor.connection, if_exists="append", index=False)
+    insert_rows("sale", sales_df, cursor)
 
 
 def load_data_to_db() -> None:
@@ -101,18 +163,27 @@ def load_data_to_db() -> None:
 
     try:
         # Connect to SQLite. Create the file if it doesn't exist
-        conn = sqlite3.connect(DB_PATH)
+        # isolation_level=None: we manage the single load transaction ourselves
+        conn = sqlite3.connect(DB_PATH, isolation_level=None)
+
+        # The database is rebuilt from scratch on every run, so trade durability for load speed.
+        # page_size must be set before the first table is created to take effect.
+        conn.execute("PRAGMA page_size=65536")
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
         cursor = conn.cursor()
 
-        # Create schema and clear existing records
+        # Create schema, clear, and reload all tables in one transaction
+        conn.execute("BEGIN IMMEDIATE")
         create_schema(cursor)
         delete_existing_records(cursor)
 
         # Load prepared data using pandas
-        customers_df = pd.read_csv(PREPARED_DATA_DIR.joinpath("customers_prepared.csv"))
-        products_df = pd.read_csv(PREPARED_DATA_DIR.joinpath("products_prepared.csv"))
+        customers_df = read_prepared_file("customers_prepared.parquet")
+        products_df = read_prepared_file("products_prepared.parquet")
         # TODO: Uncomment after implementing sales data preparation
-        sales_df = pd.read_csv(PREPARED_DATA_DIR.joinpath("sales_prepared.csv"))
+        sales_df = read_prepared_file("sales_prepared.parquet")
 
         # Rename clean columns to match database schema if necessary
         # Clean column name : Database column name
@@ -156,17 +227,34 @@ def load_data_to_db() -> None:
                 "State": "state",
             }
         )
+        # Move the low-cardinality state text into its own dimension table
+        state_df, sales_df = split_state_dimension(sales_df)
+
         # Insert data into the database for all tables
 
         insert_customers(customers_df, cursor)
 
         insert_products(products_df, cursor)
 
+        insert_states(state_df, cursor)
+
         # TODO: Uncomment after implementing sales data preparation
         insert_sales(sales_df, cursor)
 
+        # Build indexes once the data is in place
+        create_indexes(cursor)
+
         conn.commit()
         logger.info("ETL finished successfully. Data loaded into the warehouse.")
+    except Exception:
+        # journal_mode=OFF means the open transaction cannot be rolled back, so delete
+        # the partly loaded database rather than leave it for the cubing step to read
+        if conn is not None:
+            conn.close()
+            conn = None
+        logger.error(f"ETL failed. Removing partly loaded warehouse at: {DB_PATH}")
+        DB_PATH.unlink(missing_ok=True)
+        raise
     finally:
         # Regardless of success or failure, close the DB connection if it exists
         if conn is not None:
@@ -39,112 +39,103 @@ logger.info(f"OLAP_OUTPUT_DIR:     {OLAP_OUTPUT_DIR}")
 OLAP_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def ingest_sales_data_from_dw() -> pd.DataFrame:
-    """Ingest sales data from SQLite data warehouse."""
+# Shared to_csv options for cube files. %.15g keeps every significant digit of a
+# float64 sum while dropping binary round-off noise such as 11050.140000000001.
+CSV_WRITE_OPTIONS: dict = {"index": False, "lineterminator": "\n", "float_format": "%.15g"}
+CSV_CHUNKSIZE: int = 100_000
+CSV_BUFFER_SIZE: int = 1 << 20
 
-    try:
-        conn = sqlite3.connect(DB_PATH)
-        sales_df = pd.read_sql_query("SELECT * FROM sale", conn)
-        conn.close()
-        logger.info("Successfully ingested sales data from the data warehouse.")
-        return sales_df
-    except Exception as e:
-        logger.error(f"Error ingesting sales data: {e}")
-        raise
+# pandas aggregation names mapped to their SQLite aggregate functions
+SQL_AGGREGATES: dict[str, str] = {
+    "sum": "SUM",
+    "mean": "AVG",
+    "count": "COUNT",
+    "min": "MIN",
+    "max": "MAX",
+}
 
 
-def create_olap_cube(sales_df: pd.DataFrame, dimensions: list, measures: dict) -> pd.DataFrame:
-    """Create an OLAP cube by aggregating data across multiple dimensions.
+def build_cube_query(table: str, dimensions: list, measures: dict) -> str:
+    """Build a GROUP BY query that computes the OLAP cube inside SQLite.
+
+    Output columns are named <measure>_<agg>, e.g. sale_amount_sum.
 
     Args:
-        sales_df (pd.DataFrame): The sales data.
+        table (str): Name of the fact table.
         dimensions (list): List of column names to group by.
         measures (dict): Dictionary of aggregation functions for measures.
 
     Returns:
-        pd.DataFrame: The multidimensional OLAP cube.
+        str: The SQL query.
     """
+    aggregates = []
+    for column, agg_func in measures.items():
+        for func in agg_func if isinstance(agg_func, list) else [agg_func]:
+            if func not in SQL_AGGREGATES:
+                raise ValueError(f"Unsupported aggregation for SQL cube: {func}")
+            aggregates.append(f"{SQL_AGGREGATES[func]}({column}) AS {column}_{func}")
 
-    try:
-        # Group by the product ID
-        grouped = sales_df.groupby(dimensions)
-
-        # Aggregate using sale_amount
-        cube = grouped.agg(measures).reset_index()
-
-        # Add a list of sale IDs for traceability
-        """cube['sale_ids'] = grouped["sale_id"].apply(list).reset_index(drop=True)"""
+    group_by = ", ".join(dimensions)
+    return (
+        f"SELECT {group_by}, {', '.join(aggregates)} "  # noqa: S608
+        f"FROM {table} GROUP BY {group_by} ORDER BY {group_by}"
+    )
 
-        # Generate explicit column names
-        explict_columns = generate_column_names(dimensions, measures)
-        """explict_columns.append('sale_ids')"""  # Include the traceability column
-        cube.columns = explict_columns
-        logger.info("Successfully created OLAP cube.")
-        return cube
-    except Exception as e:
-        logger.error(f"Error creating OLAP cube: {e}")
-        raise
 
+def create_olap_cube_in_dw(
+    dimensions: list, measures: dict, filename: str, chunksize: int = CSV_CHUNKSIZE
+) -> int:
+    """Aggregate the sale table inside SQLite and stream the cube to a CSV file.
 
-def generate_column_names(dimensions: list, measures: dict) -> list:
-    """Generate explicit column names for OLAP cube, ensuring no trailing underscores.
+    Only the aggregated rows ever reach Python, in chunks of `chunksize`.
 
     Args:
-        dimensions (list): List of dimension columns.
-        measures (dict): Dictionary of measures with aggregation functions.
+        dimensions (list): List of column names to group by.
+        measures (dict): Dictionary of aggregation functions for measures.
+        filename (str): Name of the output CSV file.
+        chunksize (int): Number of cube rows fetched per chunk.
 
     Returns:
-        list: Explicit column names.
+        int: Number of rows written to the cube.
     """
-    column_names = dimensions.copy()
-    for column, agg_func in measures.items():
-        if isinstance(agg_func, list):
-            for func in agg_func:
-                column_names.append(f"{column}_{func}")
+    sql = build_cube_query("sale", dimensions, measures)
+    logger.info(f"Cube query: {sql}")
+    output_path = OLAP_OUTPUT_DIR.joinpath(filename)
 
-        else:
-            column_names.append(f"{column}_{agg_func}")
-    # Remove trailing underscores from all column names
-    column_names = [name.rstrip('_') for name in column_names]
-    logger.info(f"Generated column names: {column_names}")
-    return column_names
-
-
-def write_cube_to_csv(cube: pd.DataFrame, filename: str) -> None:
-    """Write the OLAP cube to a CSV file."""
+    conn = sqlite3.connect(DB_PATH)
     try:
-        output_path = OLAP_OUTPUT_DIR.joinpath(filename)
-        cube.to_csv(output_path, index=False)
-        logger.info(f"Successfully saved OLAP cube to {output_path}")
+        row_count = 0
+        with output_path.open("w", buffering=CSV_BUFFER_SIZE, newline="", encoding="utf-8") as f:
+            for i, chunk in enumerate(pd.read_sql_query(sql, conn, chunksize=chunksize)):
+                chunk.to_csv(f, header=i == 0, **CSV_WRITE_OPTIONS)
+                row_count += len(chunk)
+        logger.info(f"Successfully saved OLAP cube with {row_count} rows to {output_path}")
+        return row_count
     except Exception as e:
-        logger.error(f"Error writing OLAP cube to CSV: {e}")
+        logger.error(f"Error creating OLAP cube in the data warehouse: {e}")
         raise
+    finally:
+        conn.close()
 
 
 def main():
     """Execute the OLAP cubing process."""
     logger.info("Starting OLAP cubing process...")
 
-    # Ingest sales data
-    sales_df = ingest_sales_data_from_dw()
+    # Define dimensions and measures for the OLAP cube
+    dimensions = ["product_id"]
+    measures = {"sale_amount": ["sum"]}
+
+    # Aggregate inside the warehouse and stream the cube to CSV
+    row_count = create_olap_cube_in_dw(dimensions, measures, "sales_by_product_cube.csv")
 
-    if sales_df.empty:
+    if row_count == 0:
         logger.warning(
             "Warning: The sales table is empty. "
             "The OLAP cube will only contain column headers."
             "Fix: Prepare raw data and run the ETL step to load the data warehouse."
         )
 
-    # Define dimensions and measures for the OLAP cube
-    dimensions = ["product_id"]
-    measures = {"sale_amount": ["sum"]}
-
-    # Create OLAP cube
-    olap_cube = create_olap_cube(sales_df, dimensions, measures)
-
-    # Save OLAP cube to CSV
-    write_cube_to_csv(olap_cube, "sales_by_product_cube.csv")
-
     logger.info("OLAP Cubing process completed successfully.")
     logger.info(f"Please see outputs in {OLAP_OUTPUT_DIR}")
 
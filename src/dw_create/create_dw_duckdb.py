@@ -4,7 +4,7 @@ scripts/dw_create/create_dw_duckdb.py
 This script creates the DuckDB data warehouse using .sql files.
 
 File locations:
-- data/prepared          : cleaned and prepared CSVs (used later in ETL)
+- data/prepared          : cleaned and prepared Parquet files (used later in ETL)
 - dw/                    : data warehouse folder
 - dw/smart_sales.duckdb  : DuckDB database file
 - sql/dw_create          : folder for .sql files used to create tables
@@ -103,8 +103,8 @@ def create_dw() -> None:
 
 
 def populate_dw() -> None:
-    """Load and insert prepared CSV data into DuckDB with column mapping."""
-    logger.info("Populating DuckDB data warehouse from prepared CSVs...")
+    """Load and insert prepared Parquet data into DuckDB with column mapping."""
+    logger.info("Populating DuckDB data warehouse from prepared Parquet files...")
 
     try:
         conn = duckdb.connect(DW_PATH)
@@ -113,7 +113,7 @@ def populate_dw() -> None:
         # TODO: Add your new columns
         # TODO: Change as needed to reflect YOUR data and file names, etc.
 
-        df_customers = pd.read_csv(DATA_PREPARED_DIR / "customers_prepared.csv")
+        df_customers = pd.read_parquet(DATA_PREPARED_DIR / "customers_prepared.parquet")
         df_customers = df_customers.rename(
             columns={
                 "CustomerID": "customer_id",
@@ -133,7 +133,7 @@ def populate_dw() -> None:
         # TODO: Add your new columns
         # TODO: Change as needed to reflect YOUR data and file names, etc.
 
-        df_products = pd.read_csv(DATA_PREPARED_DIR / "products_prepared.csv")
+        df_products = pd.read_parquet(DATA_PREPARED_DIR / "products_prepared.parquet")
         df_products = df_products.rename(
             columns={
                 "ProductID": "product_id",
@@ -153,7 +153,7 @@ def populate_dw() -> None:
         # TODO: Add your new columns
         # TODO: Change as needed to reflect YOUR data and file names, etc.
 
-        df_sales = pd.read_csv(DATA_PREPARED_DIR / "sales_prepared.csv")
+        df_sales = pd.read_parquet(DATA_PREPARED_DIR / "sales_prepared.parquet")
         df_sales = df_sales.rename(
             columns={
                 "TransactionID": "sale_id",
@@ -0,0 +1,133 @@
+"""Test the raw data cleaners in data_prep.py.
+
+Module Information:
+    - Filename: test_data_prep.py
+    - Module: test_data_prep
+    - Location: tests/
+
+data_prep.py runs as a script and its name is shadowed by the data_prep
+package, so it is loaded from its file path here.
+
+These tests verify that:
+    - The sales cleaner drops bad rows, fills Shipping, and formats State
+    - SaleDate columns typed as dates or as all-null by the reader are accepted
+    - Deduplication keeps the first row per key and sorts a null key last
+    - IQR quartiles match pandas' linear-interpolation quantile
+"""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+DATA_PREP_PATH = Path(__file__).resolve().parents[1] / "src" / "analytics_project" / "data_prep.py"
+_spec = importlib.util.spec_from_file_location("data_prep_script", DATA_PREP_PATH)
+data_prep = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(data_prep)
+
+SALES_HEADER = (
+    "TransactionID,SaleDate,CustomerID,ProductID,StoreID,CampaignID,SaleAmount,Shipping,State\n"
+)
+
+
+@pytest.fixture
+def read_raw_sales(tmp_path, monkeypatch):
+    """Write CSV text to a raw sales file and read it back with read_csv_file."""
+    monkeypatch.setattr(data_prep, "RAW_DATA_DIR", tmp_path)
+
+    def read(rows: str) -> pd.DataFrame:
+        (tmp_path / "sales_data.csv").write_text(SALES_HEADER + rows)
+        return data_prep.read_csv_file("sales_data.csv")
+
+    return read
+
+
+def test_clean_sales_data_with_date_typed_sale_date(read_raw_sales):
+    """Verify dedupe, null and '?' drops, 'free' and median Shipping, State, and sort."""
+    raw_df = read_raw_sales(
+        "3,2025-05-06,1003,2003,401,1,30.0,free, ok\n"
+        "1,2025-05-04,1001,2001,401,0,10.0,4.0,ks\n"
+        "2,2025-05-05,1002,2002,402,,20.0,,tx\n"
+        "2,2025-05-05,1002,2002,402,,20.0,,tx\n"
+        "4,2025-05-07,,2004,401,0,40.0,8.0,ar\n"
+        "5,2025-05-08,1005,2005,401,0,?,2.0,ks\n"
+    )
+    # The reader types ISO dates as dates rather than strings
+    assert not pd.api.types.is_string_dtype(raw_df["SaleDate"])
+
+    cleaned = data_prep.clean_sales_data(raw_df)
+
+    assert len(cleaned) == 3
+    assert cleaned["TransactionID"].tolist() == [1, 2, 3]
+    # Median of the deduplicated Shipping values 0 ('free'), 4, 8, and 2
+    assert cleaned["Shipping"].tolist() == [4.0, 3.0, 0.0]
+    assert cleaned["State"].tolist() == ["KS", "TX", "OK"]
+    assert cleaned["CampaignID"].tolist() == [0, 0, 1]
+    assert cleaned["SaleDate"].tolist() == list(
+        pd.to_datetime(["2025-05-04", "2025-05-05", "2025-05-06"])
+    )
+
+
+def test_clean_sales_data_with_all_null_sale_date(read_raw_sales):
+    """Verify an all-empty SaleDate column drops every row instead of raising."""
+    raw_df = read_raw_sales("1,,1001,2001,401,0,10.0,4.0,ks\n2,,1002,2002,402,0,20.0,free,tx\n")
+
+    cleaned = data_prep.clean_sales_data(raw_df)
+
+    assert cleaned.empty
+    assert pd.api.types.is_datetime64_any_dtype(cleaned["SaleDate"])
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        pd.Series(["B", None, "A", "B", None], dtype=pd.ArrowDtype(pa.string())),
+        pd.Series(["B", None, "A", "B", None], dtype=object),
+        pd.Series([2, None, 1, 2, None], dtype=pd.ArrowDtype(pa.int64())),
+    ],
+    ids=["arrow-string", "object", "arrow-int"],
+)
+def test_drop_duplicates_sorted_keeps_first_row_and_sorts_null_key_last(keys):
+    """Verify one row per key survives, the first one, with the null key last."""
+    df = pd.DataFrame({"key": keys, "row": range(5)})
+
+    result = data_prep.drop_duplicates_sorted(df, "key")
+
+    assert result["row"].tolist() == [2, 0, 1]
+    assert result["key"].isna().tolist() == [False, False, True]
+    assert result.index.tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("n", [*range(1, 30), 1000, 1001])
+def test_compute_quartiles_matches_pandas_quantile(n):
+    """Verify Q1/Q3 match Series.quantile for Series and ndarray input with NaNs."""
+    rng = np.random.default_rng(n)
+    values = rng.normal(100.0, 25.0, n)
+    values[rng.random(n) < 0.2] = np.nan
+    series = pd.Series(values)
+    expected = (series.quantile(0.25), series.quantile(0.75))
+
+    assert data_prep.compute_quartiles(series) == pytest.approx(expected, rel=1e-12)
+    assert data_prep.compute_quartiles(values) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        pd.Series([], dtype="float64"),
+        pd.Series([np.nan, np.nan]),
+        pd.Series([None, None], dtype=pd.ArrowDtype(pa.float64())),
+        np.array([]),
+        np.array([np.nan, np.nan, np.nan]),
+    ],
+    ids=["empty", "all-nan", "arrow-all-null", "empty-ndarray", "all-nan-ndarray"],
+)
+def test_compute_quartiles_without_values_returns_nan(column):
+    """Verify a column with no values yields (nan, nan)."""
+    q1, q3 = data_prep.compute_quartiles(column)
+
+    assert np.isnan(q1)
+    assert np.isnan(q3)
@@ -0,0 +1,65 @@
+"""Test the warehouse loading helpers.
+
+Module Information:
+    - Filename: test_etl_to_dw.py
+    - Module: test_etl_to_dw
+    - Location: tests/
+
+These tests verify that:
+    - Sale states move into a state dimension, with NULL keys for missing states
+    - Rows are inserted by column name, with nulls stored as SQL NULL
+"""
+
+import sqlite3
+
+import pandas as pd
+import pyarrow as pa
+
+from analytics_project.etl_to_dw import insert_rows, split_state_dimension
+
+
+def test_split_state_dimension_maps_states_to_keys():
+    """Verify each distinct state gets one key and missing states get a NULL key."""
+    sales_df = pd.DataFrame(
+        {
+            "sale_id": [1, 2, 3, 4],
+            "state": pd.Series(["OK", None, "KS", "OK"], dtype=pd.ArrowDtype(pa.string())),
+        }
+    )
+
+    state_df, sales_df = split_state_dimension(sales_df)
+
+    assert state_df.to_dict("list") == {"state_id": [1, 2], "state": ["KS", "OK"]}
+    assert "state" not in sales_df.columns
+    assert sales_df["state_id"].isna().tolist() == [False, True, False, False]
+    assert sales_df["state_id"].dropna().tolist() == [2, 1, 2]
+
+
+def test_split_state_dimension_handles_all_missing_states():
+    """Verify a sales frame with no states yields an empty dimension."""
+    sales_df = pd.DataFrame({"sale_id": [1, 2], "state": [None, None]})
+
+    state_df, sales_df = split_state_dimension(sales_df)
+
+    assert state_df.empty
+    assert sales_df["state_id"].isna().all()
+
+
+def test_insert_rows_matches_columns_by_name_and_stores_nulls():
+    """Verify columns are matched by name and pd.NA/NaN become SQL NULL."""
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute("CREATE TABLE product (product_id INTEGER, category TEXT, unit_price REAL)")
+    products_df = pd.DataFrame(
+        {
+            "unit_price": pd.Series([9.5, None], dtype=pd.ArrowDtype(pa.float64())),
+            "category": pd.Series([None, "TOYS"], dtype=pd.ArrowDtype(pa.string())),
+            "product_id": pd.Series([2000, 2001], dtype=pd.ArrowDtype(pa.int64())),
+        }
+    )
+
+    insert_rows("product", products_df, cursor)
+
+    rows = cursor.execute("SELECT product_id, category, unit_price FROM product").fetchall()
+    assert rows == [(2000, None, 9.5), (2001, "TOYS", None)]
+    conn.close()
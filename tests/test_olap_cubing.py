@@ -0,0 +1,42 @@
+"""Test the OLAP cubing SQL builder.
+
+Module Information:
+    - Filename: test_olap_cubing.py
+    - Module: test_olap_cubing
+    - Location: tests/
+
+These tests verify that:
+    - Cube columns are named <measure>_<agg>
+    - A measure may name one aggregation or a list of them
+    - Unsupported aggregations are rejected before any SQL runs
+"""
+
+import pytest
+
+from analytics_project.olap.cubing import build_cube_query
+
+
+def test_build_cube_query_names_columns_by_measure_and_agg():
+    """Verify each aggregate gets a <measure>_<agg> alias."""
+    sql = build_cube_query(
+        "sale", ["product_id", "store_id"], {"sale_amount": ["sum", "mean"], "sale_id": "count"}
+    )
+
+    assert sql == (
+        "SELECT product_id, store_id, SUM(sale_amount) AS sale_amount_sum, "
+        "AVG(sale_amount) AS sale_amount_mean, COUNT(sale_id) AS sale_id_count "
+        "FROM sale GROUP BY product_id, store_id ORDER BY product_id, store_id"
+    )
+
+
+def test_build_cube_query_accepts_single_aggregation_string():
+    """Verify a measure can name one aggregation without wrapping it in a list."""
+    sql = build_cube_query("sale", ["product_id"], {"sale_amount": "max"})
+
+    assert sql.startswith("SELECT product_id, MAX(sale_amount) AS sale_amount_max FROM sale")
+
+
+def test_build_cube_query_rejects_unsupported_aggregation():
+    """Verify aggregations with no SQLite equivalent raise ValueError."""
+    with pytest.raises(ValueError, match="median"):
+        build_cube_query("sale", ["product_id"], {"sale_amount": ["sum", "median"]})